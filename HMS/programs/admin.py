@@ -12,3 +12,6 @@ class EnrollmentAdmin(admin.ModelAdmin):
     list_display = ['id', 'client', 'program', 'date_enrolled', 'active']
     search_fields = ['client__user__first_name', 'client__user__last_name', 'program__name']
     list_filter = ['program', 'active']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('client__user', 'program')
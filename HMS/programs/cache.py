@@ -0,0 +1,18 @@
+from django.core.cache import cache
+
+HEALTH_PROGRAM_LIST_TIMEOUT = 300
+_VERSION_KEY = 'health_programs:version'
+
+
+def health_program_list_key(path):
+    """Cache key for a health program list page, scoped to the current version."""
+    version = cache.get_or_set(_VERSION_KEY, 1, timeout=None)
+    return f'health_programs:{version}:{path}'
+
+
+def invalidate_health_program_list():
+    """Bump the version so every cached list page is skipped from now on."""
+    try:
+        cache.incr(_VERSION_KEY)
+    except ValueError:
+        cache.set(_VERSION_KEY, 1, timeout=None)
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.4 on 2026-10-15 20:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('programs', '0001_initial'),
+        ('userManager', '0002_customuser_role_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['program', 'active'], name='programs_en_program_ddca45_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['client', 'active'], name='programs_en_client__6204c3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['date_enrolled'], name='programs_en_date_en_9c9b44_idx'),
+        ),
+    ]
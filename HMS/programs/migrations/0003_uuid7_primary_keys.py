@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:00
+
+import userManager.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('programs', '0002_enrollment_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='enrollment',
+            name='id',
+            field=models.UUIDField(default=userManager.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='healthprogram',
+            name='id',
+            field=models.UUIDField(default=userManager.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -1,9 +1,9 @@
 from django.db import models
-import uuid
 from userManager.models import Client  # adjust if using another app name
+from userManager.utils import uuid7
 
 class HealthProgram(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
@@ -13,7 +13,7 @@ class HealthProgram(models.Model):
         return self.name
 
 class Enrollment(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name='enrollments')
     program = models.ForeignKey(HealthProgram, on_delete=models.CASCADE, related_name='enrollments')
     date_enrolled = models.DateField(auto_now_add=True)
@@ -21,6 +21,11 @@ class Enrollment(models.Model):
 
     class Meta:
         unique_together = ('client', 'program')
+        indexes = [
+            models.Index(fields=['program', 'active']),
+            models.Index(fields=['client', 'active']),
+            models.Index(fields=['date_enrolled']),
+        ]
 
     def __str__(self):
         return f"{self.client} -> {self.program}"
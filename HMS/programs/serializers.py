@@ -1,12 +1,18 @@
-from rest_framework import serializers
 from .models import HealthProgram, Enrollment
+from userManager.mixins import FieldsListSerializerMixin, CachedFieldsModelSerializer
 
-class HealthProgramSerializer(serializers.ModelSerializer):
+class HealthProgramSerializer(FieldsListSerializerMixin, CachedFieldsModelSerializer):
     class Meta:
         model = HealthProgram
-        fields = '__all__'
+        fields = ['id', 'name', 'is_active', 'created_at']
 
-class EnrollmentSerializer(serializers.ModelSerializer):
+class HealthProgramDetailSerializer(HealthProgramSerializer):
+    """Adds the description TEXT column, which the list leaves out."""
+
+    class Meta(HealthProgramSerializer.Meta):
+        fields = HealthProgramSerializer.Meta.fields + ['description']
+
+class EnrollmentSerializer(FieldsListSerializerMixin, CachedFieldsModelSerializer):
     class Meta:
         model = Enrollment
-        fields = '__all__'
+        fields = ['id', 'client', 'program', 'date_enrolled', 'active']
@@ -0,0 +1,9 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import HealthProgram
+from .cache import invalidate_health_program_list
+
+@receiver([post_save, post_delete], sender=HealthProgram)
+def clear_health_program_cache(sender, **kwargs):
+    """Drop cached program lists whenever a program changes."""
+    invalidate_health_program_list()
@@ -1,3 +1,137 @@
-from django.test import TestCase
+from unittest import mock
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers
+from rest_framework.test import APIClient
+from userManager.mixins import trace_serializer
+from userManager.models import CustomUser, Client
+from .models import HealthProgram, Enrollment
+from .serializers import EnrollmentSerializer
+from .views import EnrollmentViewSet
 
-# Create your tests here.
+
+class EnrollmentListTests(TestCase):
+    def setUp(self):
+        user = CustomUser.objects.create_user(
+            username='jane', email='jane@example.com', password='pass',
+            first_name='Jane', last_name='Doe',
+        )
+        client = Client.objects.create(user=user, national_id='123')
+        self.program = HealthProgram.objects.create(name='Malaria')
+        self.enrollment = Enrollment.objects.create(client=client, program=self.program)
+
+        self.api = APIClient()
+        self.api.force_authenticate(user)
+
+    def test_list_rows_are_a_superset_of_detail(self):
+        detail = self.api.get(f'/programs/enrollments/{self.enrollment.pk}/').json()
+        row = self.api.get('/programs/enrollments/').json()['results'][0]
+
+        self.assertEqual({key: row[key] for key in detail}, detail)
+        self.assertEqual(row['program_name'], 'Malaria')
+        self.assertEqual(row['client_first_name'], 'Jane')
+        self.assertEqual(row['client_last_name'], 'Doe')
+
+    def test_list_honours_fields(self):
+        row = self.api.get('/programs/enrollments/?fields=id,program').json()['results'][0]
+
+        self.assertEqual(set(row), {'id', 'program', 'program_name'})
+
+    def test_list_and_users_agree_on_unknown_fields(self):
+        enrollment = self.api.get('/programs/enrollments/?fields=bogus').json()['results'][0]
+        user = self.api.get('/api/users/?fields=bogus').json()['results'][0]
+
+        self.assertEqual(enrollment, {})
+        self.assertEqual(user, {})
+
+    def test_computed_fields_use_the_serializer(self):
+        class ProgramNameSerializer(EnrollmentSerializer):
+            program_name = serializers.SerializerMethodField()
+
+            class Meta(EnrollmentSerializer.Meta):
+                fields = ['id', 'program_name']
+
+            def get_program_name(self, obj):
+                return obj.program.name
+
+        with mock.patch.object(EnrollmentViewSet, 'serializer_class', ProgramNameSerializer):
+            row = self.api.get('/programs/enrollments/').json()['results'][0]
+
+        self.assertEqual(row, {'id': str(self.enrollment.pk), 'program_name': 'Malaria'})
+
+
+@override_settings(REDIS_URL='redis://localhost:6379/0')
+class HealthProgramListCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.program = HealthProgram.objects.create(name='Malaria')
+        user = CustomUser.objects.create_user(
+            username='jane', email='jane@example.com', password='pass',
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user)
+
+    def program_names(self):
+        return [row['name'] for row in self.api.get('/programs/programs/').json()['results']]
+
+    def test_list_is_served_from_cache(self):
+        self.assertEqual(self.program_names(), ['Malaria'])
+        HealthProgram.objects.filter(pk=self.program.pk).update(name='Stale')
+
+        self.assertEqual(self.program_names(), ['Malaria'])
+
+    def test_save_invalidates_list(self):
+        self.assertEqual(self.program_names(), ['Malaria'])
+        self.program.name = 'Tuberculosis'
+        self.program.save()
+
+        self.assertEqual(self.program_names(), ['Tuberculosis'])
+
+    def test_delete_invalidates_list(self):
+        self.assertEqual(self.program_names(), ['Malaria'])
+        self.program.delete()
+
+        self.assertEqual(self.program_names(), [])
+
+    @override_settings(REDIS_URL='')
+    def test_list_is_not_cached_without_shared_cache(self):
+        self.assertEqual(self.program_names(), ['Malaria'])
+        HealthProgram.objects.filter(pk=self.program.pk).update(name='Tuberculosis')
+
+        self.assertEqual(self.program_names(), ['Tuberculosis'])
+
+
+class NestedEnrollmentPrefetchTests(TestCase):
+    class ClientEnrollmentsSerializer(serializers.ModelSerializer):
+        enrollments = EnrollmentSerializer(many=True)
+
+        class Meta:
+            model = Client
+            fields = ['id', 'national_id', 'enrollments']
+
+    def setUp(self):
+        for index in range(3):
+            user = CustomUser.objects.create_user(
+                username=f'user{index}', email=f'user{index}@example.com', password='pass',
+            )
+            client = Client.objects.create(user=user, national_id=f'id{index}')
+            program = HealthProgram.objects.create(name=f'Program {index}')
+            Enrollment.objects.create(client=client, program=program)
+
+    def test_prefetch_only_loads_enrollment_columns(self):
+        serializer = self.ClientEnrollmentsSerializer()
+        select, prefetch, only = trace_serializer(serializer)
+        self.assertEqual(select, [])
+        queryset = Client.objects.prefetch_related(*prefetch).only(*only)
+
+        with CaptureQueriesContext(connection) as queries:
+            data = self.ClientEnrollmentsSerializer(queryset, many=True).data
+
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(len(data[0]['enrollments']), 1)
+        prefetch_sql = queries.captured_queries[1]['sql']
+        self.assertTrue(prefetch_sql.startswith('SELECT "programs_enrollment"."id"'))
+        self.assertNotIn('JOIN', prefetch_sql)
+        self.assertNotIn('password', prefetch_sql)
@@ -1,17 +1,84 @@
-from django.shortcuts import render
-
-# Create your views here.
-from rest_framework import viewsets
+from rest_framework import serializers, viewsets
+from rest_framework.response import Response
 from .models import HealthProgram, Enrollment
-from .serializers import HealthProgramSerializer, EnrollmentSerializer
+from .serializers import HealthProgramSerializer, HealthProgramDetailSerializer, EnrollmentSerializer
+from .cache import HEALTH_PROGRAM_LIST_TIMEOUT, health_program_list_key
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F
 from rest_framework.permissions import IsAuthenticated
+from userManager.mixins import OptimizedViewMixin
 
-class HealthProgramViewSet(viewsets.ModelViewSet):
+class HealthProgramViewSet(OptimizedViewMixin, viewsets.ModelViewSet):
     queryset = HealthProgram.objects.all()
     serializer_class = HealthProgramSerializer
     permission_classes = [IsAuthenticated]
 
-class EnrollmentViewSet(viewsets.ModelViewSet):
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return HealthProgramSerializer
+        return HealthProgramDetailSerializer
+
+    def list(self, request, *args, **kwargs):
+        # The program list is admin-managed and identical for every user, so the
+        # rendered page is cached until a program is saved or deleted. The version
+        # bump only reaches other workers through a shared cache, so without Redis
+        # the list is not cached at all.
+        if not settings.REDIS_URL:
+            return super().list(request, *args, **kwargs)
+        key = health_program_list_key(request.get_full_path())
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, HEALTH_PROGRAM_LIST_TIMEOUT)
+        return Response(data)
+
+class EnrollmentViewSet(OptimizedViewMixin, viewsets.ModelViewSet):
     queryset = Enrollment.objects.all()
     serializer_class = EnrollmentSerializer
     permission_classes = [IsAuthenticated]
+    # Read-only names shown alongside the serializer fields in the list.
+    list_extras = {
+        'program': {'program_name': F('program__name')},
+        'client': {
+            'client_first_name': F('client__user__first_name'),
+            'client_last_name': F('client__user__last_name'),
+        },
+    }
+
+    def get_list_columns(self):
+        """
+        Serializer field names if every field renders a model column as-is, so
+        .values() can stand in for the serializer; None otherwise.
+        """
+        fields = self.get_serializer().fields
+        model = self.get_queryset().model
+        for name, field in fields.items():
+            if field.write_only or isinstance(field, serializers.BaseSerializer) or field.source != name:
+                return None
+            try:
+                model_field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not model_field.concrete or model_field.many_to_many:
+                return None
+        return list(fields) or None
+
+    def list(self, request, *args, **kwargs):
+        # Read-only listing: fetch plain dicts instead of building a model
+        # instance and a serializer per row. Keys match the serializer, so each
+        # row is a superset of the detail payload. Serializers with computed or
+        # nested fields, or an empty ?fields= selection, take the regular path.
+        names = self.get_list_columns()
+        if names is None:
+            return super().list(request, *args, **kwargs)
+        extras = {}
+        for name in names:
+            extras.update(self.list_extras.get(name, {}))
+        queryset = self.filter_queryset(self.get_queryset()).values(*names, **extras)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(list(page))
+        return Response(list(queryset))
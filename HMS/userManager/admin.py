@@ -38,6 +38,9 @@ class DoctorAdmin(admin.ModelAdmin):
         return obj.user.get_full_name()
     get_name.short_description = 'Doctor Name'
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
+
 # Client Admin
 @admin.register(Client)
 class ClientAdmin(admin.ModelAdmin):
@@ -49,6 +52,9 @@ class ClientAdmin(admin.ModelAdmin):
         return obj.user.get_full_name()
     get_name.short_description = 'Client Name'
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
+
 # TimeRange Admin (optional)
 @admin.register(TimeRange)
 class TimeRangeAdmin(admin.ModelAdmin):
@@ -6,7 +6,6 @@ from rest_framework.response import Response
 from .serializers import ResendEmailVerificationSerializer,CustomTokenRefreshSerializer
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
-from rest_framework.decorators import action
 from dj_rest_auth.views import PasswordResetView
 from django.conf import settings
 from rest_framework_simplejwt.views import TokenRefreshView
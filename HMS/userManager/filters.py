@@ -1,4 +1,8 @@
 import django_filters
+from django.db import connections
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
 from .models import CustomUser
 
 class UserFilter(django_filters.FilterSet):
@@ -9,4 +13,34 @@ class UserFilter(django_filters.FilterSet):
 
     class Meta:
         model = CustomUser
-        fields = ["role", "location", "is_verified"]
\ No newline at end of file
+        fields = ["role", "location", "is_verified"]
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    On Postgres, match ?search= against the GIN-indexed `search_vector` column
+    instead of OR-ing an icontains lookup per search field, best matches first.
+    Each term is a prefix query, so `john` still finds `john@x.com` (the parser
+    keeps an email as a single lexeme) and `0712` finds `0712345678`.
+    Other databases keep the stock SearchFilter behaviour.
+    """
+    search_vector_column = 'search_vector'
+
+    def get_tsquery(self, terms):
+        # quote_literal() keeps tsquery operators in the input from being parsed.
+        term_query = "to_tsquery('simple', quote_literal(%s) || ':*')"
+        return ' && '.join([term_query] * len(terms)), tuple(terms)
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms or connections[queryset.db].vendor != 'postgresql':
+            return super().filter_queryset(request, queryset, view)
+
+        vector = f'"{queryset.model._meta.db_table}"."{self.search_vector_column}"'
+        tsquery, params = self.get_tsquery(terms)
+        match = RawSQL(f"{vector} @@ ({tsquery})", params, output_field=BooleanField())
+        rank = RawSQL(f"ts_rank({vector}, {tsquery})", params, output_field=FloatField())
+        return (
+            queryset.filter(match)
+            .alias(search_rank=rank)
+            .order_by('-search_rank', *queryset.query.order_by)
+        )
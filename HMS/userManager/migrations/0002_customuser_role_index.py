@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-15 20:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('userManager', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['role', 'is_active'], name='userManager_role_574d26_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+from django.db import migrations
+
+# Trigram GIN indexes for the admin search_fields. On Postgres, `icontains`
+# compiles to UPPER("col"::text) LIKE UPPER(%s), so the index is built on that
+# expression; an index on the raw column would never be used. Admin search ORs
+# one lookup per search field and Postgres only combines them with a BitmapOr
+# when every branch is indexed, so every column in CustomUserAdmin,
+# AddressAdmin and DoctorAdmin search_fields is covered (DoctorAdmin's
+# user__first_name/user__last_name use the customuser indexes).
+TRIGRAM_INDEXES = [
+    ('userManager_customuser', 'email', 'customuser_email_trgm'),
+    ('userManager_customuser', 'username', 'customuser_username_trgm'),
+    ('userManager_customuser', 'first_name', 'customuser_first_name_trgm'),
+    ('userManager_customuser', 'last_name', 'customuser_last_name_trgm'),
+    ('userManager_address', 'city', 'address_city_trgm'),
+    ('userManager_address', 'state', 'address_state_trgm'),
+    ('userManager_address', 'country', 'address_country_trgm'),
+    ('userManager_address', 'postal_code', 'address_postal_code_trgm'),
+    ('userManager_doctor', 'license_number', 'doctor_license_number_trgm'),
+    ('userManager_doctor', 'specialization', 'doctor_specialization_trgm'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    quote = schema_editor.quote_name
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, column, name in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {quote(name)} ON {quote(table)} '
+            f'USING GIN ((UPPER({quote(column)}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _, _, name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('userManager', '0002_customuser_role_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
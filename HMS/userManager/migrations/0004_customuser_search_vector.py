@@ -0,0 +1,45 @@
+from django.db import migrations
+
+# A generated tsvector column keeps itself in sync on INSERT/UPDATE, so no
+# trigger or backfill is needed. Only created on Postgres.
+ADD_SEARCH_VECTOR = [
+    """
+    ALTER TABLE "userManager_customuser" ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple',
+        coalesce(email, '') || ' ' || coalesce(first_name, '') || ' ' ||
+        coalesce(last_name, '') || ' ' || coalesce(phone, '') || ' ' || coalesce(role, '')
+    )) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS customuser_search_vector_gin
+    ON "userManager_customuser" USING GIN (search_vector)
+    """,
+]
+
+DROP_SEARCH_VECTOR = [
+    'DROP INDEX IF EXISTS customuser_search_vector_gin',
+    'ALTER TABLE "userManager_customuser" DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def add_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for statement in ADD_SEARCH_VECTOR:
+            schema_editor.execute(statement, params=None)
+
+
+def remove_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for statement in DROP_SEARCH_VECTOR:
+            schema_editor.execute(statement, params=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('userManager', '0003_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_vector, remove_search_vector),
+    ]
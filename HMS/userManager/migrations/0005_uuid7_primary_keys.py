@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:00
+
+import userManager.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('userManager', '0004_customuser_search_vector'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='address',
+            name='id',
+            field=models.UUIDField(default=userManager.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='customuser',
+            name='id',
+            field=models.UUIDField(default=userManager.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:15
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('userManager', '0005_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='customuser',
+            name='userManager_role_574d26_idx',
+        ),
+    ]
@@ -0,0 +1,147 @@
+import copy
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+def trace_serializer(serializer, prefix=''):
+    """
+    Walk the fields of a model serializer and return the lookups needed to render
+    it as (select_related, prefetch_related, only). `only` is None when a field
+    reads something other than a concrete model field, as deferring columns would
+    then cost an extra query per row.
+    """
+    select, prefetch, only = [], [], []
+    model = serializer.Meta.model
+
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            only = None
+            continue
+        lookup = prefix + field.source
+
+        if model_field.many_to_many or model_field.one_to_many:
+            prefetch.append(_trace_prefetch(field, lookup, model_field))
+        elif not model_field.concrete:
+            only = None
+        elif isinstance(field, serializers.BaseSerializer):
+            select.append(lookup)
+            nested_select, nested_prefetch, nested_only = trace_serializer(field, lookup + '__')
+            select += nested_select
+            prefetch += nested_prefetch
+            if only is not None:
+                only = None if nested_only is None else only + [lookup] + nested_only
+        elif only is not None:
+            only.append(lookup)
+
+    return select, prefetch, only
+
+
+def _trace_prefetch(field, lookup, model_field):
+    """
+    Prefetch a to-many field. When it renders a nested model serializer, the
+    prefetched queryset carries that serializer's own joins and columns.
+    """
+    child = getattr(field, 'child', None)
+    if not isinstance(child, serializers.ModelSerializer):
+        return lookup
+    select, prefetch, only = trace_serializer(child)
+    queryset = child.Meta.model._default_manager.all()
+    # select_related() with no arguments would follow every non-null foreign key.
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    if only is not None and model_field.one_to_many:
+        queryset = queryset.only(*only, model_field.field.name)
+    return Prefetch(lookup, queryset=queryset)
+
+
+def _parse_field_list(value):
+    if not value:
+        return set()
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+class FieldsListSerializerMixin:
+    """
+    Prune the serialized fields using the `fields` and `omit` query params.
+    Only the top-level serializer is pruned; nested serializers are left intact.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return fields
+
+        requested = self.context.get('requested_fields')
+        omitted = self.context.get('omitted_fields')
+        if requested:
+            fields = {name: field for name, field in fields.items() if name in requested}
+        if omitted:
+            fields = {name: field for name, field in fields.items() if name not in omitted}
+        return fields
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    Build the model fields once per serializer class and hand each instance a
+    deep copy, instead of re-running ModelSerializer's model introspection.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return copy.deepcopy(cached)
+
+
+class OptimizedViewMixin:
+    """
+    Derive select_related/prefetch_related/only from the serializer used for the
+    current action, so eager loading follows the serializer as it changes.
+    `?fields=` / `?omit=` on read requests are passed to the serializer, which
+    prunes its fields before they are traced.
+    """
+
+    def get_field_selection(self):
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in SAFE_METHODS:
+            return set(), set()
+        return (
+            _parse_field_list(request.query_params.get('fields')),
+            _parse_field_list(request.query_params.get('omit')),
+        )
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['requested_fields'], context['omitted_fields'] = self.get_field_selection()
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        if getattr(getattr(serializer_class, 'Meta', None), 'model', None) is None:
+            return queryset
+
+        serializer = serializer_class(context=self.get_serializer_context())
+        select, prefetch, only = trace_serializer(serializer)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        # Deferring columns on writes would leave auto_now fields out of the UPDATE.
+        request = getattr(self, 'request', None)
+        if only and request is not None and request.method in SAFE_METHODS:
+            queryset = queryset.only(*only)
+        return queryset
@@ -1,12 +1,12 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
-import uuid
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from .utils import uuid7
 
 # Address Model (Reusable)
 class Address(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     street = models.CharField(max_length=255, blank=True, null=True)
     city = models.CharField(max_length=100)
     state = models.CharField(max_length=100, blank=True, null=True)
@@ -19,6 +19,11 @@ class Address(models.Model):
         return f"{self.city}, {self.country}"
 
 # Custom User Model
+# On Postgres, migration 0004 adds a generated `search_vector` column computed
+# from email, first_name, last_name, phone and role. Postgres rejects changing
+# the type of a column a generated column depends on, so an AlterField on any
+# of those fields needs a migration that drops search_vector first and re-adds
+# it afterwards.
 class CustomUser(AbstractUser):
     ROLE_CHOICES = (
         ('admin', 'Admin'),
@@ -26,7 +31,7 @@ class CustomUser(AbstractUser):
         ('client', 'Client'),
     )
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(unique=True)
     first_name = models.CharField(max_length=50)
     last_name = models.CharField(max_length=50)
@@ -79,7 +84,7 @@ class Client(models.Model):
 # Signal to auto-create default working hours for doctors
 @receiver(post_save, sender=Doctor)
 def create_default_doctor_hours(sender, instance, created, **kwargs):
-    if created and not instance.working_hours:
-        default_hours = TimeRange.objects.create(start='09:00', end='17:00')
-        instance.working_hours = default_hours
-        instance.save()
+    if created and not instance.working_hours_id:
+        instance.working_hours = TimeRange.objects.create(start='09:00', end='17:00')
+        # Write just the FK; instance.save() would rewrite the row and re-fire post_save.
+        Doctor.objects.filter(pk=instance.pk).update(working_hours=instance.working_hours)
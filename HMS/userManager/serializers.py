@@ -5,13 +5,17 @@ from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from django.core.exceptions import ObjectDoesNotExist
 from rest_framework.exceptions import ValidationError
 from .models import Doctor, Client, Address
+from .mixins import FieldsListSerializerMixin, CachedFieldsModelSerializer
 
 User = get_user_model()
 
 class AddressSerializer(serializers.ModelSerializer):
     class Meta:
         model = Address
-        fields = '__all__'
+        fields = [
+            "id", "street", "city", "state", "country",
+            "postal_code", "latitude", "longitude"
+        ]
 
 class CustomRegisterSerializer(RegisterSerializer):
     role = serializers.ChoiceField(choices=User.ROLE_CHOICES)
@@ -54,7 +58,9 @@ class CustomRegisterSerializer(RegisterSerializer):
             address = Address.objects.create(**address_data)
             user.address = address
 
-        user.save()
+        # The user row was already inserted by RegisterSerializer.save(); only
+        # write the columns set here instead of re-saving every field.
+        user.save(update_fields=["role", "phone", "address"])
 
         if user.role == "doctor":
             Doctor.objects.create(
@@ -89,7 +95,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
                 instance.address = Address.objects.create(**address_data)
         return super().update(instance, validated_data)
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(FieldsListSerializerMixin, CachedFieldsModelSerializer):
     address = AddressSerializer()
 
     class Meta:
@@ -100,13 +106,9 @@ class UserSerializer(serializers.ModelSerializer):
         ]
 
 class ResendEmailVerificationSerializer(serializers.Serializer):
+    # Existence is checked once, against EmailAddress, in ResendEmailVerificationView.
     email = serializers.EmailField()
 
-    def validate_email(self, value):
-        if not User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("No account found with this email.")
-        return value
-
 class CustomTokenRefreshSerializer(TokenRefreshSerializer):
     def validate(self, attrs):
         try:
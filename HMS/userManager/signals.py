@@ -1,4 +1,4 @@
-from django.db.models.signals import post_migrate, post_save, pre_save
+from django.db.models.signals import post_migrate
 from django.dispatch import receiver
 from django.contrib.auth.models import Group
 from django.conf import settings
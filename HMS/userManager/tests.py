@@ -1,3 +1,119 @@
+import time
+import uuid
+from unittest import mock
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from .filters import FullTextSearchFilter
+from .mixins import trace_serializer
+from .models import CustomUser, Address
+from .serializers import UserSerializer
+from .utils import uuid7
 
-# Create your tests here.
+
+class TraceSerializerTests(TestCase):
+    def test_nested_foreign_key_is_selected(self):
+        select, prefetch, only = trace_serializer(UserSerializer())
+
+        self.assertEqual(select, ['address'])
+        self.assertEqual(prefetch, [])
+        self.assertEqual(only, [
+            'id', 'email', 'first_name', 'last_name', 'role', 'phone', 'address',
+            'address__id', 'address__street', 'address__city', 'address__state',
+            'address__country', 'address__postal_code', 'address__latitude',
+            'address__longitude', 'date_joined',
+        ])
+
+    def test_non_model_field_disables_only(self):
+        class NameSerializer(serializers.ModelSerializer):
+            full_name = serializers.CharField(source='get_full_name')
+
+            class Meta:
+                model = CustomUser
+                fields = ['id', 'full_name']
+
+        self.assertEqual(trace_serializer(NameSerializer()), ([], [], None))
+
+
+class UserFieldSelectionTests(TestCase):
+    def setUp(self):
+        address = Address.objects.create(city='Nairobi', country='Kenya')
+        self.user = CustomUser.objects.create_user(
+            username='jane', email='jane@example.com', password='pass',
+            first_name='Jane', last_name='Doe', address=address,
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def list_users(self, query=''):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api.get(f'/api/users/{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results'][0], queries.captured_queries[-1]['sql']
+
+    def test_full_list_joins_address(self):
+        row, sql = self.list_users()
+
+        self.assertEqual(row['address']['city'], 'Nairobi')
+        self.assertIn('JOIN "userManager_address"', sql)
+
+    def test_fields_prunes_columns_and_join(self):
+        row, sql = self.list_users('?fields=id,email')
+
+        self.assertEqual(row, {'id': str(self.user.pk), 'email': 'jane@example.com'})
+        self.assertNotIn('JOIN', sql)
+        self.assertNotIn('"first_name"', sql)
+
+    def test_omit_drops_join(self):
+        row, sql = self.list_users('?omit=address')
+
+        self.assertNotIn('address', row)
+        self.assertNotIn('JOIN', sql)
+        self.assertIn('"first_name"', sql)
+
+
+
+class FullTextSearchFilterTests(TestCase):
+    def search_sql(self, query):
+        request = Request(APIRequestFactory().get('/api/users/', {'search': query}))
+        with mock.patch.object(connection, 'vendor', 'postgresql'):
+            queryset = FullTextSearchFilter().filter_queryset(request, CustomUser.objects.all(), None)
+        return str(queryset.query)
+
+    def test_each_term_is_a_prefix_query(self):
+        sql = self.search_sql('john 0712')
+
+        self.assertEqual(sql.count("to_tsquery('simple', quote_literal(john) || ':*')"), 2)
+        self.assertEqual(sql.count("to_tsquery('simple', quote_literal(0712) || ':*')"), 2)
+        self.assertNotIn('plainto_tsquery', sql)
+
+
+class UUID7Tests(TestCase):
+    def test_version_and_variant(self):
+        value = uuid7()
+
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_leading_bits_are_the_millisecond_timestamp(self):
+        with mock.patch.object(time, 'time_ns', return_value=1_700_000_000_123_456_789):
+            value = uuid7()
+
+        self.assertEqual(value.int >> 80, 1_700_000_000_123)
+
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        self.assertTrue(before <= value.int >> 80 <= after)
+
+    def test_later_milliseconds_sort_after_earlier_ones(self):
+        values = []
+        for timestamp_ms in (1_700_000_000_000, 1_700_000_000_001, 1_700_000_001_000):
+            with mock.patch.object(time, 'time_ns', return_value=timestamp_ms * 1_000_000):
+                values.append(uuid7())
+
+        self.assertEqual(sorted(values), values)
+        self.assertEqual(sorted(str(value) for value in values), [str(value) for value in values])
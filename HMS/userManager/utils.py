@@ -0,0 +1,16 @@
+import os
+import time
+import uuid
+
+
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7). New primary keys sort after older
+    ones, so inserts append to the end of the B-tree index instead of landing
+    on random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
@@ -1,14 +1,16 @@
-from rest_framework import viewsets, filters
+from rest_framework import viewsets
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from dj_rest_auth.registration.views import RegisterView
 from .models import CustomUser
 from .serializers import UserSerializer, UserUpdateSerializer, CustomRegisterSerializer
+from .mixins import OptimizedViewMixin
+from .filters import FullTextSearchFilter
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(OptimizedViewMixin, viewsets.ModelViewSet):
     queryset = CustomUser.objects.all().order_by("-date_joined")
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter]
     search_fields = ["email", "phone", "first_name", "last_name", "role"]
 
     def get_serializer_class(self):